@@ -1,21 +1,150 @@
 import sys
-import json
 import os
+import time
+import threading
+import sqlite3
+import queue
+import atexit
 import logging  # <-- Importação do logging
-import requests
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QLineEdit,
     QComboBox, QPushButton, QLabel, QMessageBox, QSpacerItem, QSizePolicy
 )
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QDoubleValidator
+from PySide6.QtCore import Qt, QLocale, QObject, QRunnable, QThreadPool, QTimer, Signal
+
+# orjson é opcional: decodifica direto de bytes e é mais rápido que o json da biblioteca padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Definição do nome do arquivo de configuração e estilo
 CONFIG_FILE = "config.json"
 STYLE_FILE = "style.qss"
+# Cache persistente de cotações (sobrevive entre execuções)
+RATES_FILE = "rates.sqlite"
+# Idade máxima (em segundos) de uma cotação salva em disco para ainda ser usada
+RATES_DISK_MAX_AGE = 24 * 60 * 60
+# Aviso exibido junto da data quando a cotação vem do cache em disco
+AVISO_CACHE_LOCAL = " (cache local)"
 # URL da API de cotação (exemplo para AwesomeAPI)
-API_URL_TEMPLATE = "https://economia.awesomeapi.com.br/json/last/{origem}-{destino}"
+API_URL_BASE = "https://economia.awesomeapi.com.br/json/last/"
+# Tempo (em segundos) que uma cotação obtida permanece válida em memória
+QUOTE_CACHE_TTL = 30.0
+# Quantidade máxima de pares mantidos no cache de cotações
+QUOTE_CACHE_MAX = 64
+# Moedas disponíveis
+MOEDAS = ["USD", "BRL", "EUR", "JPY", "ARS", "CAD", "AUD", "GBP", "CHF"]
+# Moeda base da tabela de taxas pré-carregada
+MOEDA_BASE = "USD"
+
+
+def _json_loads(conteudo):
+    """
+    Decodifica JSON a partir de bytes, usando o orjson quando disponível.
+    """
+    if orjson is not None:
+        return orjson.loads(conteudo)
+
+    import json
+    return json.loads(conteudo)
+
+
+def _json_dumps(dados):
+    """
+    Codifica um objeto em JSON compacto (bytes), usando o orjson quando disponível.
+    """
+    if orjson is not None:
+        return orjson.dumps(dados)
+
+    import json
+    return json.dumps(dados, separators=(",", ":")).encode("utf-8")
+
+
+def _criar_adaptador_https():
+    """
+    Cria o adaptador HTTPS da sessão, com pool de conexões reduzido.
+    Falhas transitórias (conexão ou 502/503/504) são repetidas pelo próprio urllib3.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    tentativas = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], allowed_methods=["GET"])
+    return HTTPAdapter(max_retries=tentativas, pool_connections=2, pool_maxsize=4)
+
+
+class QuoteWorker(QRunnable):
+    """
+    Executa a busca da cotação fora da thread da interface e devolve o
+    resultado (ou o erro) para a janela principal através de sinais.
+    """
+
+    class Sinais(QObject):
+        # (valor, cotacao, data_cotacao, par_usado)
+        finished = Signal(float, float, str, str)
+        # (titulo, mensagem)
+        failed = Signal(str, str)
+
+    def __init__(self, obter_cotacao, origem, destino, valor):
+        super().__init__()
+        self._obter_cotacao = obter_cotacao
+        self._origem = origem
+        self._destino = destino
+        self._valor = valor
+        self.sinais = self.Sinais()
+
+    def run(self):
+        # 'requests' é importado sob demanda (ver ConversorApp.http) para não atrasar a abertura da janela
+        import requests
+
+        try:
+            cotacao, data_cotacao_str, par_usado = self._obter_cotacao(self._origem, self._destino)
+        except ValueError as ve:
+            # LOG: Erro de API/Validação
+            logging.error("Erro de API/Validação (ValueError): %s", ve)
+            self.sinais.failed.emit("Erro de API", f"Valor inválido ou erro de cotação. Detalhe: {ve}")
+        except requests.exceptions.RequestException as re:
+            # LOG: Erro de Conexão
+            logging.error("Falha de Conexão (RequestException): %s", re)
+            self.sinais.failed.emit("Erro de Conexão",
+                                    f"Falha ao conectar na API. Verifique sua internet. Detalhe: {re}")
+        except Exception as e:
+            # LOG: Erro Desconhecido
+            logging.critical("Erro Desconhecido: %s", e)
+            self.sinais.failed.emit("Erro Desconhecido", f"Ocorreu um erro inesperado: {e}")
+        else:
+            self.sinais.finished.emit(self._valor, cotacao, data_cotacao_str, par_usado)
+
+
+class RatesWorker(QRunnable):
+    """
+    Busca em segundo plano a tabela de taxas de todas as moedas contra a
+    moeda base, em uma única requisição.
+    """
+
+    class Sinais(QObject):
+        # (taxas, data_cotacao)
+        finished = Signal(object, str)
+        # (mensagem)
+        failed = Signal(str)
+
+    def __init__(self, buscar_taxas):
+        super().__init__()
+        self._buscar_taxas = buscar_taxas
+        self.sinais = self.Sinais()
+
+    def run(self):
+        try:
+            taxas, data_cotacao_str = self._buscar_taxas()
+        except Exception as e:
+            self.sinais.failed.emit(str(e))
+        else:
+            self.sinais.finished.emit(taxas, data_cotacao_str)
 
 
 class ConversorApp(QMainWindow):
@@ -24,18 +153,61 @@ class ConversorApp(QMainWindow):
         self.setWindowTitle("Conversor de Moedas")
         self.resize(500, 300)
 
+        # Sessão HTTP persistente, criada no primeiro uso (ver a propriedade 'http')
+        self._http = None
+        self._http_lock = threading.Lock()
+        # Executa as requisições direta e inversa em paralelo
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="http")
+
+        # Cache de cotações: (origem, destino) -> (cotacao, data, par_usado, instante)
+        self._quote_cache: dict[tuple[str, str], tuple[float, str, str, float]] = {}
+        self._quote_ttl = QUOTE_CACHE_TTL
+
+        # Taxas pré-carregadas: moeda -> valor de 1 unidade na moeda base
+        self._rates: dict[str, float] = {}
+        self._rates_data = "-"
+
+        # Cache persistente de cotações, usado na inicialização e quando a API está inacessível
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._abrir_cache_disco()
+
+        # Última configuração lida/gravada em disco (evita releitura e regravação)
+        self._config_loaded = None
+
         # 1. Configuração da Interface
         self._setup_ui()
 
         # 2. Carregar a configuração inicial (moedas salvas)
         self.carregar_config()
 
-        # 3. Conectar o botão
+        # 3. Conectar o botão (habilitado apenas com um valor válido no campo)
+        self._conversao_em_andamento = False
         self.btn_converter.clicked.connect(self.converter_moeda)
+        self.input_valor.textChanged.connect(self._atualizar_botao)
+        self._atualizar_botao()
+
+        # 4. Pré-carregar a tabela de taxas em segundo plano
+        self._atualizar_taxas()
 
         # LOG: Aplicação iniciada
         logging.info("Aplicação Conversor de Moedas Iniciada.")
 
+    @property
+    def http(self):
+        """
+        Sessão HTTP persistente que reaproveita conexões (keep-alive) entre requisições.
+        O 'requests' só é importado no primeiro acesso, fora do caminho de abertura da janela.
+        """
+        with self._http_lock:
+            if self._http is None:
+                import requests
+
+                self._http = requests.Session()
+                self._http.headers.update({"Accept": "application/json", "User-Agent": "ConversorApp"})
+                self._http.mount("https://", _criar_adaptador_https())
+            return self._http
+
     def _setup_ui(self):
         """Define e organiza todos os widgets da interface e aplica os IDs para o QSS."""
 
@@ -46,57 +218,56 @@ class ConversorApp(QMainWindow):
         main_layout.setContentsMargins(30, 30, 30, 30)
         main_layout.setSpacing(15)
 
+        # Atalhos locais (evitam buscas de atributo repetidas)
+        add = main_layout.addWidget
+        centro = Qt.AlignCenter
+
         # --- Rótulos de Cabeçalho ---
-        lbl_titulo = QLabel("Conversor de Moedas Global")
-        lbl_titulo.setObjectName("HeaderLabel")
-        lbl_titulo.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(lbl_titulo)
+        # Propriedades Qt passadas no construtor (menos chamadas Python -> C++)
+        add(QLabel("Conversor de Moedas Global", alignment=centro, objectName="HeaderLabel"))
 
         # --- Input de Valor ---
-        self.input_valor = QLineEdit()
-        self.input_valor.setPlaceholderText("Insira o valor a ser convertido")
-        main_layout.addWidget(self.input_valor)
+        self.input_valor = QLineEdit(placeholderText="Insira o valor (ex.: 1.234,56)")
+        # Formato numérico pt_BR (milhar com '.' e decimal com ','), independente do sistema
+        self._locale_br = QLocale(QLocale.Portuguese, QLocale.Brazil)
+        # Validação feita pelo Qt a cada tecla: só aceita números positivos no formato pt_BR
+        self._validador = QDoubleValidator(0.000001, 1e15, 8, self)
+        self._validador.setNotation(QDoubleValidator.StandardNotation)
+        self._validador.setLocale(self._locale_br)
+        self.input_valor.setValidator(self._validador)
+        add(self.input_valor)
 
         # --- Comboboxes de Moeda ---
         self.combo_origem = QComboBox()
         self.combo_destino = QComboBox()
 
-        # Moedas disponíveis
-        moedas = ["USD", "BRL", "EUR", "JPY", "ARS", "CAD", "AUD", "GBP", "CHF"]
-        self.combo_origem.addItems(moedas)
-        self.combo_destino.addItems(moedas)
+        self.combo_origem.addItems(MOEDAS)
+        self.combo_destino.addItems(MOEDAS)
+        # Índice de cada moeda nos comboboxes (evita buscas com findText)
+        self._moeda_index = {moeda: i for i, moeda in enumerate(MOEDAS)}
 
         # Layout Horizontal para Comboboxes
         combo_layout = QHBoxLayout()
-        combo_layout.addWidget(self.combo_origem)
-
-        label_para = QLabel("→")
-        label_para.setAlignment(Qt.AlignCenter)
-        label_para.setObjectName("QLabel")
-        combo_layout.addWidget(label_para)
-
-        combo_layout.addWidget(self.combo_destino)
+        add_combo = combo_layout.addWidget
+        add_combo(self.combo_origem)
+        add_combo(QLabel("→", alignment=centro, objectName="QLabel"))
+        add_combo(self.combo_destino)
         main_layout.addLayout(combo_layout)
 
         # --- Botão Converter ---
-        self.btn_converter = QPushButton("CONVERTER")
+        self.btn_converter = QPushButton("CONVERTER", objectName="QPushButton")
         self.btn_converter.setCursor(Qt.PointingHandCursor)
-        self.btn_converter.setObjectName("QPushButton")
-        main_layout.addWidget(self.btn_converter)
+        add(self.btn_converter)
 
         # --- Resultado e Rodapé ---
-        self.lbl_resultado = QLabel("0,00")
-        self.lbl_resultado.setObjectName("ResultadoDisplay")
-        self.lbl_resultado.setAlignment(Qt.AlignCenter)
-
-        self.lbl_data_cotacao = QLabel("Fonte: AwesomeAPI | Última Cotação: -")
-        self.lbl_data_cotacao.setObjectName("FooterLabel")
-        self.lbl_data_cotacao.setAlignment(Qt.AlignCenter)
+        self.lbl_resultado = QLabel("0,00", alignment=centro, objectName="ResultadoDisplay")
+        self.lbl_data_cotacao = QLabel("Fonte: AwesomeAPI | Última Cotação: -",
+                                       alignment=centro, objectName="FooterLabel")
 
         # Adiciona ao Layout Principal
-        main_layout.addWidget(self.lbl_resultado)
+        add(self.lbl_resultado)
         main_layout.addStretch()
-        main_layout.addWidget(self.lbl_data_cotacao)
+        add(self.lbl_data_cotacao)
 
     # =================================================================
     # FUNÇÕES DE CONFIGURAÇÃO (config.json)
@@ -105,26 +276,33 @@ class ConversorApp(QMainWindow):
     def carregar_config(self):
         """
         Carrega as configurações de moeda inicial do arquivo config.json.
+        O conteúdo lido fica em memória, então chamadas seguintes não releem o arquivo.
         """
-        if not os.path.exists(CONFIG_FILE):
+        if self._config_loaded is None and not os.path.exists(CONFIG_FILE):
             # LOG: Arquivo de config não encontrado
-            logging.warning(f"Arquivo '{CONFIG_FILE}' não encontrado. Usando padrões: USD e BRL.")
+            logging.warning("Arquivo '%s' não encontrado. Usando padrões: USD e BRL.", CONFIG_FILE)
             return
 
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            if self._config_loaded is None:
+                with open(CONFIG_FILE, 'rb') as f:
+                    config = _json_loads(f.read())
 
-            origem = config.get("origem")
-            destino = config.get("destino")
+                self._config_loaded = {
+                    "origem": config.get("origem") or "USD",
+                    "destino": config.get("destino") or "BRL"
+                }
+
+            origem = self._config_loaded["origem"]
+            destino = self._config_loaded["destino"]
 
             if origem:
-                index_origem = self.combo_origem.findText(origem)
+                index_origem = self._moeda_index.get(origem, -1)
                 if index_origem >= 0:
                     self.combo_origem.setCurrentIndex(index_origem)
 
             if destino:
-                index_destino = self.combo_destino.findText(destino)
+                index_destino = self._moeda_index.get(destino, -1)
                 if index_destino >= 0:
                     self.combo_destino.setCurrentIndex(index_destino)
 
@@ -133,11 +311,12 @@ class ConversorApp(QMainWindow):
 
         except Exception as e:
             # LOG: Falha ao carregar configurações
-            logging.error(f"Falha ao carregar configurações: {e}")
+            logging.error("Falha ao carregar configurações: %s", e)
 
     def closeEvent(self, event):
         """
-        Salva as configurações atuais de moeda antes de fechar a janela.
+        Salva as configurações atuais de moeda antes de fechar a janela,
+        apenas se elas mudaram desde a última leitura/gravação.
         """
 
         config_atual = {
@@ -145,139 +324,374 @@ class ConversorApp(QMainWindow):
             "destino": self.combo_destino.currentText()
         }
 
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config_atual, f, indent=4)
+        if config_atual != self._config_loaded:
+            try:
+                with open(CONFIG_FILE, 'wb') as f:
+                    f.write(_json_dumps(config_atual))
+                self._config_loaded = config_atual
 
                 # LOG: Configurações salvas
-            logging.info("Configurações salvas com sucesso ao fechar.")
+                logging.info("Configurações salvas com sucesso ao fechar.")
 
-        except Exception as e:
-            # LOG: Erro ao salvar configurações
-            logging.error(f"Erro ao salvar configurações: {e}")
+            except Exception as e:
+                # LOG: Erro ao salvar configurações
+                logging.error("Erro ao salvar configurações: %s", e)
+
+        # Encerra as conexões abertas da sessão HTTP, se ela chegou a ser criada
+        if self._http is not None:
+            self._http.close()
+
+        # Descarta requisições ainda pendentes
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+        # Fecha o cache de cotações em disco
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
         event.accept()
 
+    # =================================================================
+    # FUNÇÕES DE CACHE EM DISCO (rates.sqlite)
+    # =================================================================
+
+    def _abrir_cache_disco(self):
+        """
+        Abre (ou cria) o arquivo rates.sqlite e pré-carrega a tabela de taxas
+        com as cotações salvas na última execução (ignorando as mais antigas que RATES_DISK_MAX_AGE).
+        A coluna 'bid' guarda quanto vale 1 unidade da primeira moeda do par na segunda.
+        """
+        try:
+            self._db = sqlite3.connect(RATES_FILE, isolation_level=None, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS rates("
+                "pair TEXT PRIMARY KEY, bid REAL, create_date TEXT, fetched_at REAL)")
+            linhas = self._db.execute(
+                "SELECT pair, bid, create_date FROM rates WHERE fetched_at >= ?",
+                (time.time() - RATES_DISK_MAX_AGE,)).fetchall()
+        except sqlite3.Error as e:
+            # LOG: Falha ao abrir o cache em disco
+            logging.error("Falha ao abrir o cache de cotações '%s': %s", RATES_FILE, e)
+            self._db = None
+            return
+
+        datas = []
+        for par, bid, create_date in linhas:
+            moeda = par[:3]
+            if par == f"{moeda}{MOEDA_BASE}" and moeda in MOEDAS:
+                self._rates[moeda] = bid
+                datas.append(create_date)
+
+        if datas:
+            self._rates[MOEDA_BASE] = 1.0
+            # Usa a data mais antiga (não superestima o frescor) e sinaliza a origem local
+            # até que _on_rates_ready receba a tabela atualizada da API
+            self._rates_data = min(datas) + AVISO_CACHE_LOCAL
+
+            # LOG: Taxas carregadas do disco
+            logging.info("Tabela de taxas carregada do disco (%d moedas).", len(self._rates))
+
+    def _salvar_cache_disco(self, linhas):
+        """
+        Grava no disco uma lista de (par, bid, create_date).
+        """
+        agora = time.time()
+        with self._db_lock:
+            # A verificação fica sob a trava: o closeEvent pode fechar a conexão em paralelo
+            if self._db is None:
+                return
+
+            try:
+                # Uma única transação para o lote (em autocommit, cada linha seria gravada separadamente)
+                self._db.execute("BEGIN")
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO rates(pair, bid, create_date, fetched_at) VALUES (?, ?, ?, ?)",
+                    [(par, bid, create_date, agora) for par, bid, create_date in linhas])
+                self._db.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._db.rollback()
+
+                # LOG: Falha ao gravar o cache em disco
+                logging.error("Falha ao gravar o cache de cotações: %s", e)
+
+    def _ler_cache_disco(self, origem, destino):
+        """
+        Procura no disco a última cotação conhecida do par (direto ou inverso).
+        Retorna (cotacao, data, par_usado) ou None.
+        """
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return None
+
+                for par, inverter in ((origem + destino, False), (destino + origem, True)):
+                    linha = self._db.execute(
+                        "SELECT bid, create_date FROM rates WHERE pair = ? AND fetched_at >= ?",
+                        (par, time.time() - RATES_DISK_MAX_AGE)).fetchone()
+                    if linha:
+                        bid, create_date = linha
+                        return (1 / bid if inverter else bid), create_date, par
+        except sqlite3.Error as e:
+            # LOG: Falha ao ler o cache em disco
+            logging.error("Falha ao ler o cache de cotações: %s", e)
+
+        return None
+
     # =================================================================
     # FUNÇÕES DE CONVERSÃO E API (Correção do erro de par)
     # =================================================================
 
+    def _atualizar_taxas(self):
+        """
+        Dispara a atualização da tabela de taxas em segundo plano.
+        """
+        worker = RatesWorker(self._buscar_taxas)
+        worker.sinais.finished.connect(self._on_rates_ready)
+        worker.sinais.failed.connect(self._on_rates_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _buscar_taxas(self):
+        """
+        Busca, em uma única requisição, a cotação de todas as moedas contra a moeda base.
+        Retorna (taxas, data) ou lança exceção.
+        """
+        pares = ",".join(f"{moeda}-{MOEDA_BASE}" for moeda in MOEDAS if moeda != MOEDA_BASE)
+        url = API_URL_BASE + pares
+
+        resposta = self.http.get(url, timeout=10)
+        resposta.raise_for_status()
+        dados = _json_loads(resposta.content)
+
+        taxas = {MOEDA_BASE: 1.0}
+        linhas = []
+        for moeda in MOEDAS:
+            par = f"{moeda}{MOEDA_BASE}"
+            dados_moeda = dados.get(par)
+            if dados_moeda:
+                taxas[moeda] = float(dados_moeda["bid"])
+                linhas.append((par, taxas[moeda], dados_moeda["create_date"]))
+
+        self._salvar_cache_disco(linhas)
+
+        # create_date vem no formato "AAAA-MM-DD HH:MM:SS", então min() retorna a mais antiga:
+        # uma cotação cruzada é tão atual quanto a mais antiga das duas pontas
+        data_api = min((linha[2] for linha in linhas), default="-")
+
+        return taxas, data_api
+
+    def _on_rates_ready(self, taxas, data_cotacao_str):
+        """
+        Atualiza a tabela de taxas e agenda a próxima atualização.
+        """
+        self._rates = taxas
+        self._rates_data = data_cotacao_str
+
+        # LOG: Tabela de taxas atualizada
+        logging.info("Tabela de taxas atualizada (%d moedas).", len(taxas))
+
+        QTimer.singleShot(int(self._quote_ttl * 1000), self._atualizar_taxas)
+
+    def _on_rates_failed(self, mensagem):
+        """
+        Mantém a tabela atual (as conversões recorrem à API por par) e tenta novamente depois.
+        """
+        # LOG: Falha ao atualizar a tabela de taxas
+        logging.warning("Falha ao atualizar a tabela de taxas: %s", mensagem)
+
+        QTimer.singleShot(int(self._quote_ttl * 1000), self._atualizar_taxas)
+
     def _obter_cotacao(self, origem, destino):
         """
-        Faz a requisição na API, tentando a ordem direta e, em caso de falha,
-        a ordem inversa (solução para o erro de API).
+        Retorna a cotação do par, usando o cache em memória enquanto ela
+        estiver dentro do TTL e consultando a API caso contrário.
         Retorna (cotacao, data, par_usado) ou lança exceção.
         """
+        chave = (origem, destino)
+        agora = time.monotonic()
 
-        par_direto_chave = f"{origem}{destino}"
-        url_direta = API_URL_TEMPLATE.format(origem=origem, destino=destino)
-
-        par_inverso_chave = f"{destino}{origem}"
-        url_inversa = API_URL_TEMPLATE.format(origem=destino, destino=origem)
+        entrada = self._quote_cache.get(chave)
+        if entrada is not None and agora - entrada[3] < self._quote_ttl:
+            return entrada[0], entrada[1], entrada[2]
 
         try:
-            # 1. Tenta a Cotação Direta
-            resposta = requests.get(url_direta, timeout=10)
-            resposta.raise_for_status()
-            dados = resposta.json()
+            cotacao, data_api, par_usado = self._consultar_api(origem, destino)
+        except Exception as e:
+            # Falhas transitórias não devem permanecer no cache
+            self._quote_cache.pop(chave, None)
 
-            if par_direto_chave in dados:
-                dados_moeda = dados[par_direto_chave]
-                cotacao_bid = float(dados_moeda["bid"])
-                data_api = dados_moeda["create_date"]
-                return cotacao_bid, data_api, par_direto_chave
+            # Sem acesso à API: usa a última cotação salva em disco, se houver
+            salva = self._ler_cache_disco(origem, destino)
+            if salva is None:
+                raise
 
+            # LOG: Usando cotação salva
+            logging.warning("API indisponível para %s%s. Usando cotação salva. Detalhe: %s", origem, destino, e)
+            cotacao, data_api, par_usado = salva
+            return cotacao, data_api + AVISO_CACHE_LOCAL, par_usado
+
+        self._salvar_cache_disco([(origem + destino, cotacao, data_api)])
+        self._guardar_cotacao(chave, cotacao, data_api, par_usado, agora)
+        self._guardar_cotacao((destino, origem), 1 / cotacao, data_api, par_usado, agora)
+        return cotacao, data_api, par_usado
+
+    def _guardar_cotacao(self, chave, cotacao, data_api, par_usado, instante):
+        """
+        Armazena uma cotação no cache, descartando a mais antiga ao atingir o limite.
+        """
+        self._quote_cache.pop(chave, None)
+        if len(self._quote_cache) >= QUOTE_CACHE_MAX:
+            # dicts preservam a ordem de inserção: o primeiro item é o mais antigo
+            self._quote_cache.pop(next(iter(self._quote_cache)))
+        self._quote_cache[chave] = (cotacao, data_api, par_usado, instante)
+
+    def _consultar_api(self, origem, destino):
+        """
+        Faz a requisição na API nas ordens direta e inversa ao mesmo tempo
+        (solução para o erro de API). A cotação direta tem preferência; a inversa,
+        já em andamento, só é usada se a direta falhar.
+        Retorna (cotacao, data, par_usado) ou lança exceção.
+        """
+
+        par_direto_chave = origem + destino
+        url_direta = f"{API_URL_BASE}{origem}-{destino}"
+
+        par_inverso_chave = destino + origem
+        url_inversa = f"{API_URL_BASE}{destino}-{origem}"
+
+        # Ambas são disparadas juntas para que a inversa não custe outra ida e volta.
+        # Quando a direta responde, a inversa é simplesmente descartada ao terminar.
+        futuro_direto = self._executor.submit(self._buscar_par, url_direta, par_direto_chave, False)
+        futuro_inverso = self._executor.submit(self._buscar_par, url_inversa, par_inverso_chave, True)
+
+        try:
+            # 1. Tenta a Cotação Direta
+            resultado = futuro_direto.result()
         except Exception as e:
             # LOG: Falha na cotação direta
             logging.warning(
-                f"Falha na cotação direta ({par_direto_chave}). Tentando inversa ({par_inverso_chave}). Detalhe: {e}")
+                "Falha na cotação direta (%s). Usando inversa (%s). Detalhe: %s",
+                par_direto_chave, par_inverso_chave, e)
+        else:
+            return resultado
 
-            try:
-                # 2. Tenta a Cotação Inversa
-                resposta = requests.get(url_inversa, timeout=10)
-                resposta.raise_for_status()
-                dados = resposta.json()
-
-                if par_inverso_chave in dados:
-                    dados_moeda = dados[par_inverso_chave]
-                    cotacao_bid = 1 / float(dados_moeda["bid"])
-                    data_api = dados_moeda["create_date"]
-                    return cotacao_bid, data_api, par_inverso_chave
-
-            except Exception:
-                # Se ambas falharam, o erro será tratado abaixo
-                pass
-
-        # Se saiu dos try/except sem sucesso, lança erro.
+        try:
+            # 2. Tenta a Cotação Inversa
+            return futuro_inverso.result()
+        except Exception as e:
+            # LOG: Falha na cotação inversa
+            logging.warning("Falha na cotação inversa (%s). Detalhe: %s", par_inverso_chave, e)
+
+        # Se nenhuma das duas respondeu com sucesso, lança erro.
         raise ValueError(
             f"O par de moedas {origem}-{destino} e o par inverso não foram encontrados ou a API está indisponível.")
 
+    def _buscar_par(self, url, chave, inverter):
+        """
+        Busca um único par na API; com 'inverter', devolve 1/bid.
+        Retorna (cotacao, data, par_usado) ou lança exceção.
+        """
+        resposta = self.http.get(url, timeout=10)
+        resposta.raise_for_status()
+        dados = _json_loads(resposta.content)
+
+        if chave not in dados:
+            raise ValueError(f"Par {chave} ausente na resposta da API.")
+
+        dados_moeda = dados[chave]
+        cotacao_bid = float(dados_moeda["bid"])
+        if inverter:
+            cotacao_bid = 1 / cotacao_bid
+        return cotacao_bid, dados_moeda["create_date"], chave
+
     def converter_moeda(self):
         """
         Implementa a lógica principal de conversão de moeda.
         """
         moeda_origem = self.combo_origem.currentText()
         moeda_destino = self.combo_destino.currentText()
-        valor_texto = self.input_valor.text().replace(',', '.')
+        valor_texto = self.input_valor.text()
 
-        # LOG: Iniciando a conversão
-        logging.info(f"Iniciando conversão de {valor_texto} {moeda_origem} para {moeda_destino}.")
+        # 1. Valor: o validador do campo garante um número positivo; basta convertê-lo
+        if not self.input_valor.hasAcceptableInput():
+            return
+        valor = self._locale_br.toDouble(valor_texto)[0]
 
+        # Mesma moeda: o resultado é o próprio valor, sem consultar a API
         if moeda_origem == moeda_destino:
-            QMessageBox.warning(self, "Aviso", "As moedas de origem e destino não podem ser as mesmas.")
+            self._on_quote_ready(valor, 1.0, "local", f"{moeda_origem}{moeda_destino}")
             return
 
-        try:
-            # 1. Validação do Valor
-            if not valor_texto:
-                QMessageBox.warning(self, "Aviso", "Por favor, insira um valor.")
-                return
+        # LOG: Iniciando a conversão
+        logging.info("Iniciando conversão de %s %s para %s.", valor_texto, moeda_origem, moeda_destino)
 
-            valor = float(valor_texto)
-            if valor <= 0:
-                QMessageBox.warning(self, "Aviso", "O valor deve ser maior que zero.")
-                return
+        # 2. Usa a tabela pré-carregada quando ambas as moedas estão nela
+        if moeda_origem in self._rates and moeda_destino in self._rates:
+            cotacao = self._rates[moeda_origem] / self._rates[moeda_destino]
+            self._on_quote_ready(valor, cotacao, self._rates_data, f"{moeda_origem}{moeda_destino} (via {MOEDA_BASE})")
+            return
+
+        # 3. Caso contrário, obtém a Cotação da API (com fallback) em segundo plano
+        self._conversao_em_andamento = True
+        self._atualizar_botao()
+        worker = QuoteWorker(self._obter_cotacao, moeda_origem, moeda_destino, valor)
+        worker.sinais.finished.connect(self._on_quote_ready)
+        worker.sinais.failed.connect(self._on_quote_failed)
+        QThreadPool.globalInstance().start(worker)
 
-            # 2. Obter Cotação da API (com fallback)
-            cotacao, data_cotacao_str, par_usado = self._obter_cotacao(moeda_origem, moeda_destino)
+    def _atualizar_botao(self):
+        """
+        Habilita o botão apenas com um valor aceito pelo validador e nenhuma conversão em andamento.
+        """
+        self.btn_converter.setEnabled(self.input_valor.hasAcceptableInput() and not self._conversao_em_andamento)
 
-            # 3. Calcular Resultado
-            resultado = valor * cotacao
+    def _on_quote_ready(self, valor, cotacao, data_cotacao_str, par_usado):
+        """
+        Recebe a cotação obtida pelo QuoteWorker e exibe o resultado.
+        """
+        self._conversao_em_andamento = False
+        self._atualizar_botao()
 
-            # 4. Formatação e Exibição
-            texto_resultado = f"{resultado:,.2f}"
-            texto_resultado = texto_resultado.replace(",", "_").replace(".", ",").replace("_", ".")  # Inverte . e ,
+        # Calcular Resultado
+        resultado = valor * cotacao
 
-            self.lbl_resultado.setText(texto_resultado)
+        # Formatação e Exibição
+        texto_resultado = self._locale_br.toString(resultado, 'f', 2)
 
-            self.lbl_data_cotacao.setText(
-                f"Fonte: AwesomeAPI | Par Usado: {par_usado} | Última Cotação: {data_cotacao_str}")
+        self.lbl_resultado.setText(texto_resultado)
 
-            # LOG: Conversão concluída com sucesso
-            logging.info(f"Conversão concluída. Resultado: {resultado:.2f} {moeda_destino} (Cotação: {cotacao:.4f}).")
+        self.lbl_data_cotacao.setText(
+            f"Fonte: AwesomeAPI | Par Usado: {par_usado} | Última Cotação: {data_cotacao_str}")
 
-        except ValueError as ve:
-            # LOG: Erro de API/Validação
-            logging.error(f"Erro de API/Validação (ValueError): {ve}")
-            QMessageBox.critical(self, "Erro de API", f"Valor inválido ou erro de cotação. Detalhe: {ve}")
-        except requests.exceptions.RequestException as re:
-            # LOG: Erro de Conexão
-            logging.error(f"Falha de Conexão (RequestException): {re}")
-            QMessageBox.critical(self, "Erro de Conexão",
-                                 f"Falha ao conectar na API. Verifique sua internet. Detalhe: {re}")
-        except Exception as e:
-            # LOG: Erro Desconhecido
-            logging.critical(f"Erro Desconhecido: {e}")
-            QMessageBox.critical(self, "Erro Desconhecido", f"Ocorreu um erro inesperado: {e}")
+        # LOG: Conversão concluída com sucesso
+        logging.info("Conversão concluída. Resultado: %.2f (Par Usado: %s, Cotação: %.4f).",
+                     resultado, par_usado, cotacao)
+
+    def _on_quote_failed(self, titulo, mensagem):
+        """
+        Exibe o erro reportado pelo QuoteWorker.
+        """
+        self._conversao_em_andamento = False
+        self._atualizar_botao()
+        QMessageBox.critical(self, titulo, mensagem)
 
 
 # Bloco de execução principal da aplicação
 if __name__ == "__main__":
     # CONFIGURAÇÃO DE LOGGING: Escreve no arquivo 'conversor.log'
-    logging.basicConfig(filename='conversor.log',
-                        level=logging.INFO,  # Nível de logging
-                        format='%(asctime)s - %(levelname)s - %(message)s',
-                        encoding='utf-8')
+    # As chamadas de log apenas enfileiram o registro; a escrita em disco
+    # acontece na thread do QueueListener, fora da thread da interface.
+    fila_log = queue.Queue(-1)
+
+    file_handler = logging.FileHandler('conversor.log', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    logging.basicConfig(level=logging.INFO,  # Nível de logging
+                        handlers=[logging.handlers.QueueHandler(fila_log)])
+
+    log_listener = logging.handlers.QueueListener(fila_log, file_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
     app = QApplication(sys.argv)
 
@@ -286,13 +700,12 @@ if __name__ == "__main__":
 
     # CARREGA O STYLE.QSS
     try:
-        with open(STYLE_FILE, 'r', encoding='utf-8') as f:
-            app.setStyleSheet(f.read())
-        logging.info(f"Estilo '{STYLE_FILE}' carregado com sucesso.")
+        app.setStyleSheet(Path(STYLE_FILE).read_bytes().decode("utf-8"))
+        logging.info("Estilo '%s' carregado com sucesso.", STYLE_FILE)
     except FileNotFoundError:
-        logging.error(f"Arquivo de estilo '{STYLE_FILE}' não encontrado. A interface não será estilizada.")
+        logging.error("Arquivo de estilo '%s' não encontrado. A interface não será estilizada.", STYLE_FILE)
     except Exception as e:
-        logging.error(f"Erro ao carregar o estilo: {e}")
+        logging.error("Erro ao carregar o estilo: %s", e)
 
     window = ConversorApp()
     window.show()